@@ -437,8 +437,8 @@ def _login_with_device_code() -> None:
         ) as progress:
             task = progress.add_task("Waiting for authentication...", total=None)
 
-            start_time = time.time()
-            while time.time() - start_time < expires_in:
+            deadline = time.monotonic() + expires_in
+            while time.monotonic() < deadline:
                 time.sleep(interval)
 
                 try:
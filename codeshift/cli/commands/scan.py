@@ -1,6 +1,8 @@
 """Scan command for discovering all possible migrations in a project."""
 
 import json
+import re
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, cast
 
@@ -14,21 +16,34 @@ from rich.table import Table
 from codeshift.knowledge import generate_knowledge_base_sync, is_tier_1_library
 from codeshift.scanner import DependencyParser
 from codeshift.utils.config import ProjectConfig
+from codeshift.utils.pypi import map_pypi_lookups
 
 console = Console()
 
+# Matches the first "major.minor[.patch]" number in a version spec
+VERSION_NUMBER_PATTERN = re.compile(r"(\d+\.\d+(?:\.\d+)?)")
 
-def get_latest_version(package: str) -> str | None:
+# PyPI API timeout. Update checks only need the latest version, so this is
+# more lenient than the health metrics' timeout to tolerate slow networks.
+PYPI_TIMEOUT = 10.0
+
+
+def get_latest_version(package: str, client: httpx.Client | None = None) -> str | None:
     """Fetch the latest version of a package from PyPI.
 
     Args:
         package: Package name.
+        client: Optional shared HTTP client to reuse connections across lookups.
 
     Returns:
         Latest version string or None.
     """
+    url = f"https://pypi.org/pypi/{package}/json"
     try:
-        response = httpx.get(f"https://pypi.org/pypi/{package}/json", timeout=10.0)
+        if client is None:
+            response = httpx.get(url, timeout=PYPI_TIMEOUT)
+        else:
+            response = client.get(url)
         if response.status_code == 200:
             return cast(str | None, response.json().get("info", {}).get("version"))
     except Exception:
@@ -36,6 +51,18 @@ def get_latest_version(package: str) -> str | None:
     return None
 
 
+def iter_latest_versions(packages: list[str]) -> Iterator[str | None]:
+    """Fetch the latest versions of several packages from PyPI concurrently.
+
+    Args:
+        packages: Package names.
+
+    Yields:
+        Latest version string or None for each package, in input order.
+    """
+    yield from map_pypi_lookups(get_latest_version, packages, timeout=PYPI_TIMEOUT)
+
+
 def parse_version(version_spec: str) -> str | None:
     """Extract a version number from a version spec.
 
@@ -45,9 +72,7 @@ def parse_version(version_spec: str) -> str | None:
     Returns:
         Extracted version or None.
     """
-    import re
-
-    match = re.search(r"(\d+\.\d+(?:\.\d+)?)", version_spec)
+    match = VERSION_NUMBER_PATTERN.search(version_spec)
     if match:
         return match.group(1)
     return None
@@ -174,11 +199,11 @@ def scan(
     ) as progress:
         task = progress.add_task("Checking for updates...", total=len(dependencies))
 
-        for dep in dependencies:
+        latest_versions = iter_latest_versions([dep.name for dep in dependencies])
+        for dep, latest_version in zip(dependencies, latest_versions, strict=True):
             progress.update(task, description=f"Checking {dep.name}...")
 
             current_version = parse_version(dep.version_spec) if dep.version_spec else None
-            latest_version = get_latest_version(dep.name)
 
             if latest_version and current_version:
                 if compare_versions(current_version, latest_version):
@@ -12,6 +12,7 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from codeshift.cli.commands.scan import parse_version
 from codeshift.cli.quota import QuotaError, check_quota, record_usage, show_quota_exceeded_message
 from codeshift.knowledge import (
     Confidence,
@@ -211,11 +212,7 @@ def upgrade(
             )
             # Extract version number from spec (e.g., ">=1.0,<2.0" -> "1.0")
             if current_dep.version_spec:
-                import re
-
-                version_match = re.search(r"(\d+\.\d+(?:\.\d+)?)", current_dep.version_spec)
-                if version_match:
-                    current_version = version_match.group(1)
+                current_version = parse_version(current_dep.version_spec)
         else:
             console.print(f"[yellow]Warning:[/] {library} not found in project dependencies")
 
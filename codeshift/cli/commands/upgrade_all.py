@@ -12,8 +12,8 @@ from rich.table import Table
 
 from codeshift.cli.commands.scan import (
     compare_versions,
-    get_latest_version,
     is_major_upgrade,
+    iter_latest_versions,
     parse_version,
 )
 from codeshift.knowledge import (
@@ -44,6 +44,7 @@ def save_multi_state(project_path: Path, state: dict) -> None:
 def run_single_upgrade(
     library: str,
     target: str,
+    current_version: str | None,
     project_path: Path,
     project_config: ProjectConfig,
     verbose: bool,
@@ -53,6 +54,7 @@ def run_single_upgrade(
     Args:
         library: Library name to upgrade.
         target: Target version.
+        current_version: Currently pinned version, as found by the update check.
         project_path: Path to the project.
         project_config: Project configuration.
         verbose: Whether to show verbose output.
@@ -63,18 +65,6 @@ def run_single_upgrade(
     results: list[TransformResult] = []
     generated_kb: GeneratedKnowledgeBase | None = None
 
-    # Get current version
-    dep_parser = DependencyParser(project_path)
-    current_dep = dep_parser.get_dependency(library)
-
-    current_version = None
-    if current_dep and current_dep.version_spec:
-        import re
-
-        version_match = re.search(r"(\d+\.\d+(?:\.\d+)?)", current_dep.version_spec)
-        if version_match:
-            current_version = version_match.group(1)
-
     # Fetch knowledge sources
     try:
         generated_kb = generate_knowledge_base_sync(
@@ -261,11 +251,11 @@ def upgrade_all(
     ) as progress:
         task = progress.add_task("Checking for updates...", total=len(dependencies))
 
-        for dep in dependencies:
+        latest_versions = iter_latest_versions([dep.name for dep in dependencies])
+        for dep, latest_version in zip(dependencies, latest_versions, strict=True):
             progress.update(task, description=f"Checking {dep.name}...")
 
             current_version = parse_version(dep.version_spec) if dep.version_spec else None
-            latest_version = get_latest_version(dep.name)
 
             if latest_version and current_version:
                 if compare_versions(current_version, latest_version):
@@ -372,6 +362,7 @@ def upgrade_all(
             results, generated_kb = run_single_upgrade(
                 library=str(pkg["name"]),
                 target=str(pkg["latest"]),
+                current_version=str(pkg["current"]),
                 project_path=project_path,
                 project_config=project_config,
                 verbose=verbose,
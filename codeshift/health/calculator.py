@@ -3,6 +3,9 @@
 import logging
 from pathlib import Path
 
+import httpx
+from packaging.version import Version
+
 from codeshift.health.metrics import BaseMetricCalculator
 from codeshift.health.metrics.documentation import DocumentationCalculator
 from codeshift.health.metrics.freshness import FreshnessCalculator
@@ -16,10 +19,15 @@ from codeshift.health.models import (
     HealthScore,
     MetricResult,
     SecurityVulnerability,
+    VulnerabilitySeverity,
 )
+from codeshift.utils.pypi import map_pypi_lookups
 
 logger = logging.getLogger(__name__)
 
+# PyPI API timeout, shared with the other health metrics
+PYPI_TIMEOUT = 5.0
+
 
 class HealthCalculator:
     """Orchestrates health score calculation across all metrics."""
@@ -58,7 +66,7 @@ class HealthCalculator:
                 )
                 metrics.append(result)
             except Exception as e:
-                logger.warning(f"Failed to calculate {calculator.category.value}: {e}")
+                logger.warning("Failed to calculate %s: %s", calculator.category.value, e)
                 # Add a neutral result on failure
                 metrics.append(
                     MetricResult(
@@ -127,62 +135,21 @@ class HealthCalculator:
         raw_deps = parser.parse_all()
 
         # Get knowledge base info for tier support
-        from codeshift.knowledge_base import KnowledgeBaseLoader
+        from codeshift.knowledge_base import TIER_1_LIBRARIES, KnowledgeBaseLoader
 
         loader = KnowledgeBaseLoader()
-        supported_libraries = loader.get_supported_libraries()
-        tier1_libraries = {"pydantic", "fastapi", "sqlalchemy", "pandas", "requests"}
+        supported_libraries = {lib.lower() for lib in loader.get_supported_libraries()}
 
         dependencies: list[DependencyHealth] = []
 
-        for dep in raw_deps:
-            dep_name_lower = dep.name.lower()
-
-            # Get latest version and vulnerabilities from PyPI
-            latest_version = None
-            vulnerabilities: list[SecurityVulnerability] = []
-
-            try:
-                import httpx
-                from packaging.version import Version
-
-                response = httpx.get(
-                    f"https://pypi.org/pypi/{dep.name}/json",
-                    timeout=5.0,
-                )
-                if response.status_code == 200:
-                    data = response.json()
-
-                    # Get latest version
-                    version_str = data.get("info", {}).get("version")
-                    if version_str:
-                        latest_version = Version(version_str)
-
-                    # Get vulnerabilities
-                    from codeshift.health.models import VulnerabilitySeverity
-
-                    for vuln_data in data.get("vulnerabilities", []):
-                        try:
-                            severity = VulnerabilitySeverity.MEDIUM
-                            vulnerabilities.append(
-                                SecurityVulnerability(
-                                    package=dep.name,
-                                    vulnerability_id=vuln_data.get("id", "unknown"),
-                                    severity=severity,
-                                    description=vuln_data.get("summary", "")[:200],
-                                    fixed_in=(
-                                        vuln_data.get("fixed_in", [None])[0]
-                                        if vuln_data.get("fixed_in")
-                                        else None
-                                    ),
-                                    url=vuln_data.get("link"),
-                                )
-                            )
-                        except Exception:
-                            pass
+        pypi_info = list(
+            map_pypi_lookups(
+                self._fetch_pypi_info, [d.name for d in raw_deps], timeout=PYPI_TIMEOUT
+            )
+        )
 
-            except Exception as e:
-                logger.debug(f"Failed to fetch PyPI data for {dep.name}: {e}")
+        for dep, (latest_version, vulnerabilities) in zip(raw_deps, pypi_info, strict=True):
+            dep_name_lower = dep.name.lower()
 
             # Calculate version lag
             current = dep.min_version
@@ -197,8 +164,8 @@ class HealthCalculator:
                     minor_behind = max(0, latest_version.minor - current.minor)
 
             # Check tier support
-            has_tier1 = dep_name_lower in tier1_libraries
-            has_tier2 = dep_name_lower in [lib.lower() for lib in supported_libraries]
+            has_tier1 = dep_name_lower in TIER_1_LIBRARIES
+            has_tier2 = dep_name_lower in supported_libraries
 
             dependencies.append(
                 DependencyHealth(
@@ -215,3 +182,54 @@ class HealthCalculator:
             )
 
         return dependencies
+
+    def _fetch_pypi_info(
+        self, package_name: str, client: httpx.Client
+    ) -> tuple[Version | None, list[SecurityVulnerability]]:
+        """Fetch the latest version and known vulnerabilities for a package.
+
+        Args:
+            package_name: Name of the package
+            client: Shared HTTP client used for the request
+
+        Returns:
+            Tuple of (latest version or None, list of vulnerabilities)
+        """
+        latest_version: Version | None = None
+        vulnerabilities: list[SecurityVulnerability] = []
+
+        try:
+            response = client.get(f"https://pypi.org/pypi/{package_name}/json")
+            if response.status_code == 200:
+                data = response.json()
+
+                # Get latest version
+                version_str = data.get("info", {}).get("version")
+                if version_str:
+                    latest_version = Version(version_str)
+
+                # Get vulnerabilities
+                for vuln_data in data.get("vulnerabilities", []):
+                    try:
+                        severity = VulnerabilitySeverity.MEDIUM
+                        vulnerabilities.append(
+                            SecurityVulnerability(
+                                package=package_name,
+                                vulnerability_id=vuln_data.get("id", "unknown"),
+                                severity=severity,
+                                description=vuln_data.get("summary", "")[:200],
+                                fixed_in=(
+                                    vuln_data.get("fixed_in", [None])[0]
+                                    if vuln_data.get("fixed_in")
+                                    else None
+                                ),
+                                url=vuln_data.get("link"),
+                            )
+                        )
+                    except Exception:
+                        pass
+
+        except Exception as e:
+            logger.debug("Failed to fetch PyPI data for %s: %s", package_name, e)
+
+        return latest_version, vulnerabilities
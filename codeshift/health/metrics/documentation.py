@@ -1,16 +1,37 @@
 """Documentation quality metric calculator."""
 
+import ast
 import logging
+import os
+import warnings
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
-import libcst as cst
-
 from codeshift.health.metrics import BaseMetricCalculator
 from codeshift.health.models import MetricCategory, MetricResult
 
 logger = logging.getLogger(__name__)
 
+# Common non-source directories excluded from analysis
+EXCLUDED_PATTERNS = (
+    ".venv",
+    "venv",
+    ".git",
+    "__pycache__",
+    ".tox",
+    ".eggs",
+    "build",
+    "dist",
+    ".mypy_cache",
+    ".pytest_cache",
+)
+
+
+def _is_excluded(path: str) -> bool:
+    """Check whether a path falls under one of the excluded patterns."""
+    return any(pattern in path for pattern in EXCLUDED_PATTERNS)
+
 
 class DocumentationCalculator(BaseMetricCalculator):
     """Calculates documentation score (10% weight).
@@ -37,57 +58,43 @@ class DocumentationCalculator(BaseMetricCalculator):
         Returns:
             MetricResult with documentation score
         """
-        # Find all Python files
-        python_files = list(project_path.rglob("*.py"))
-
-        # Exclude common non-source directories
-        excluded_patterns = [
-            ".venv",
-            "venv",
-            ".git",
-            "__pycache__",
-            ".tox",
-            ".eggs",
-            "build",
-            "dist",
-            ".mypy_cache",
-            ".pytest_cache",
-        ]
-
-        python_files = [
-            f for f in python_files if not any(pattern in str(f) for pattern in excluded_patterns)
-        ]
-
-        if not python_files:
-            return self._create_result(
-                score=100,
-                description="No Python files to analyze",
-                details={"file_count": 0},
-                recommendations=[],
-            )
-
         # Analyze files
+        file_count = 0
         total_functions = 0
         typed_functions = 0
         documented_functions = 0
 
-        for file_path in python_files:
+        for file_path in self._iter_python_files(project_path):
+            file_count += 1
             try:
                 source = file_path.read_text()
-                tree = cst.parse_module(source)
+                # Invalid escapes etc. in user code would otherwise print a
+                # SyntaxWarning (DeprecationWarning before 3.12) per literal
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", SyntaxWarning)
+                    warnings.simplefilter("ignore", DeprecationWarning)
+                    tree = ast.parse(source, filename=str(file_path))
                 stats = self._analyze_file(tree)
 
                 total_functions += stats["total"]
                 typed_functions += stats["typed"]
                 documented_functions += stats["documented"]
             except Exception as e:
-                logger.debug(f"Failed to analyze {file_path}: {e}")
+                logger.debug("Failed to analyze %s: %s", file_path, e)
+
+        if file_count == 0:
+            return self._create_result(
+                score=100,
+                description="No Python files to analyze",
+                details={"file_count": 0},
+                recommendations=[],
+            )
 
         if total_functions == 0:
             return self._create_result(
                 score=100,
                 description="No functions found to analyze",
-                details={"file_count": len(python_files), "function_count": 0},
+                details={"file_count": file_count, "function_count": 0},
                 recommendations=[],
             )
 
@@ -111,7 +118,7 @@ class DocumentationCalculator(BaseMetricCalculator):
             score=score,
             description=f"{typed_ratio:.0%} typed, {documented_ratio:.0%} documented",
             details={
-                "file_count": len(python_files),
+                "file_count": file_count,
                 "function_count": total_functions,
                 "typed_count": typed_functions,
                 "documented_count": documented_functions,
@@ -121,19 +128,37 @@ class DocumentationCalculator(BaseMetricCalculator):
             recommendations=recommendations,
         )
 
-    def _analyze_file(self, tree: cst.Module) -> dict:
+    def _iter_python_files(self, project_path: Path) -> Iterator[Path]:
+        """Yield Python files under the project, skipping non-source directories.
+
+        Excluded directories are pruned during the walk so that virtualenvs and
+        build trees are never descended into.
+
+        Args:
+            project_path: Path to the project
+
+        Yields:
+            Paths of Python files to analyze
+        """
+        for root, dirnames, filenames in os.walk(project_path):
+            dirnames[:] = [d for d in dirnames if not _is_excluded(os.path.join(root, d))]
+            for filename in filenames:
+                if filename.endswith(".py"):
+                    file_path = os.path.join(root, filename)
+                    if not _is_excluded(file_path):
+                        yield Path(file_path)
+
+    def _analyze_file(self, tree: ast.Module) -> dict:
         """Analyze a file for type hints and docstrings.
 
         Args:
-            tree: Parsed CST module
+            tree: Parsed AST module
 
         Returns:
             Dict with total, typed, and documented counts
         """
         visitor = FunctionAnalyzer()
-        # Use MetadataWrapper to walk the tree with the visitor
-        wrapper = cst.MetadataWrapper(tree)
-        wrapper.visit(visitor)
+        visitor.visit(tree)
 
         return {
             "total": visitor.total_functions,
@@ -142,15 +167,15 @@ class DocumentationCalculator(BaseMetricCalculator):
         }
 
 
-class FunctionAnalyzer(cst.CSTVisitor):
-    """CST visitor to analyze functions for type hints and docstrings."""
+class FunctionAnalyzer(ast.NodeVisitor):
+    """AST visitor to analyze functions for type hints and docstrings."""
 
     def __init__(self) -> None:
         self.total_functions = 0
         self.typed_functions = 0
         self.documented_functions = 0
 
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
         self.total_functions += 1
 
         # Check for type hints
@@ -161,9 +186,12 @@ class FunctionAnalyzer(cst.CSTVisitor):
         if self._has_docstring(node):
             self.documented_functions += 1
 
-        return True  # Continue visiting nested functions
+        # Continue visiting nested functions
+        self.generic_visit(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
 
-    def _has_type_hints(self, node: cst.FunctionDef) -> bool:
+    def _has_type_hints(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
         """Check if a function has type hints.
 
         Args:
@@ -177,13 +205,13 @@ class FunctionAnalyzer(cst.CSTVisitor):
             return True
 
         # Check parameter types
-        for param in node.params.params:
-            if param.annotation is not None:
+        for arg in node.args.args:
+            if arg.annotation is not None:
                 return True
 
         return False
 
-    def _has_docstring(self, node: cst.FunctionDef) -> bool:
+    def _has_docstring(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
         """Check if a function has a docstring.
 
         Args:
@@ -192,18 +220,14 @@ class FunctionAnalyzer(cst.CSTVisitor):
         Returns:
             True if function has a docstring
         """
-        if not node.body.body:
-            return False
-
-        first_stmt = node.body.body[0]
+        first_stmt = node.body[0]
 
         # Check if first statement is an expression statement with a string
-        if isinstance(first_stmt, cst.SimpleStatementLine):
-            if first_stmt.body and isinstance(first_stmt.body[0], cst.Expr):
-                expr = first_stmt.body[0].value
-                if isinstance(expr, (cst.SimpleString, cst.ConcatenatedString)):
-                    return True
-                if isinstance(expr, cst.FormattedString):
-                    return True
+        if isinstance(first_stmt, ast.Expr):
+            expr = first_stmt.value
+            if isinstance(expr, ast.Constant) and isinstance(expr.value, (str, bytes)):
+                return True
+            if isinstance(expr, ast.JoinedStr):
+                return True
 
         return False
@@ -142,7 +142,7 @@ class FreshnessCalculator(BaseMetricCalculator):
                     )
                 )
             except Exception as e:
-                logger.debug(f"Error analyzing {dep.name}: {e}")
+                logger.debug("Error analyzing %s: %s", dep.name, e)
                 # Add with unknown status
                 results.append(
                     DependencyHealth(
@@ -175,6 +175,6 @@ class FreshnessCalculator(BaseMetricCalculator):
                 if version_str:
                     return Version(version_str)
         except Exception as e:
-            logger.debug(f"Failed to get latest version for {package_name}: {e}")
+            logger.debug("Failed to get latest version for %s: %s", package_name, e)
 
         return None
@@ -6,7 +6,7 @@ from typing import Any
 
 from codeshift.health.metrics import BaseMetricCalculator
 from codeshift.health.models import DependencyHealth, MetricCategory, MetricResult
-from codeshift.knowledge_base import KnowledgeBaseLoader
+from codeshift.knowledge_base import TIER_1_LIBRARIES, KnowledgeBaseLoader
 from codeshift.scanner.dependency_parser import DependencyParser
 
 logger = logging.getLogger(__name__)
@@ -112,21 +112,18 @@ class MigrationReadinessCalculator(BaseMetricCalculator):
         dependencies = parser.parse_all()
 
         loader = KnowledgeBaseLoader()
-        supported_libraries = loader.get_supported_libraries()
+        supported_libraries = {lib.lower() for lib in loader.get_supported_libraries()}
 
         results: list[DependencyHealth] = []
 
-        # Tier 1 supported libraries (have AST transformers)
-        tier1_libraries = {"pydantic", "fastapi", "sqlalchemy", "pandas", "requests"}
-
         for dep in dependencies:
             dep_name_lower = dep.name.lower()
 
             # Check Tier 1 support (deterministic AST transforms)
-            has_tier1 = dep_name_lower in tier1_libraries
+            has_tier1 = dep_name_lower in TIER_1_LIBRARIES
 
             # Check Tier 2 support (knowledge base exists)
-            has_tier2 = dep_name_lower in [lib.lower() for lib in supported_libraries]
+            has_tier2 = dep_name_lower in supported_libraries
 
             results.append(
                 DependencyHealth(
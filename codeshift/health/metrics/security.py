@@ -200,7 +200,7 @@ class SecurityCalculator(BaseMetricCalculator):
                     )
 
         except Exception as e:
-            logger.debug(f"Failed to get vulnerabilities for {package_name}: {e}")
+            logger.debug("Failed to get vulnerabilities for %s: %s", package_name, e)
 
         return vulns
 
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import re
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +11,12 @@ from codeshift.health.models import MetricCategory, MetricResult
 
 logger = logging.getLogger(__name__)
 
+# Percentage figure in an htmlcov index page, e.g. "85%"
+HTMLCOV_PERCENT_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*%")
+
+# Cobertura line-rate attribute, e.g. line-rate="0.85"
+COBERTURA_LINE_RATE_PATTERN = re.compile(r'line-rate="(\d+(?:\.\d+)?)"')
+
 
 class TestCoverageCalculator(BaseMetricCalculator):
     """Calculates test coverage score (15% weight).
@@ -86,7 +93,7 @@ class TestCoverageCalculator(BaseMetricCalculator):
                 percent = totals.get("percent_covered", 0)
                 return percent / 100, "coverage.json"
             except Exception as e:
-                logger.debug(f"Failed to parse coverage.json: {e}")
+                logger.debug("Failed to parse coverage.json: %s", e)
 
         # Try .coverage SQLite database
         coverage_db = project_path / ".coverage"
@@ -142,7 +149,7 @@ class TestCoverageCalculator(BaseMetricCalculator):
                 return float(covered_lines / total_lines) if total_lines > 0 else None
 
         except Exception as e:
-            logger.debug(f"Failed to read .coverage database: {e}")
+            logger.debug("Failed to read .coverage database: %s", e)
 
         return None
 
@@ -156,15 +163,13 @@ class TestCoverageCalculator(BaseMetricCalculator):
             Coverage percentage as 0-1 or None
         """
         try:
-            import re
-
             content = index_path.read_text()
             # Look for patterns like "85%" or "coverage: 85"
-            match = re.search(r"(\d+(?:\.\d+)?)\s*%", content)
+            match = HTMLCOV_PERCENT_PATTERN.search(content)
             if match:
                 return float(match.group(1)) / 100
         except Exception as e:
-            logger.debug(f"Failed to parse htmlcov: {e}")
+            logger.debug("Failed to parse htmlcov: %s", e)
 
         return None
 
@@ -178,14 +183,12 @@ class TestCoverageCalculator(BaseMetricCalculator):
             Coverage percentage as 0-1 or None
         """
         try:
-            import re
-
             content = xml_path.read_text()
             # Look for line-rate="0.85" attribute
-            match = re.search(r'line-rate="(\d+(?:\.\d+)?)"', content)
+            match = COBERTURA_LINE_RATE_PATTERN.search(content)
             if match:
                 return float(match.group(1))
         except Exception as e:
-            logger.debug(f"Failed to parse coverage.xml: {e}")
+            logger.debug("Failed to parse coverage.xml: %s", e)
 
         return None
@@ -10,6 +10,7 @@ from codeshift.knowledge.models import (
 )
 from codeshift.knowledge.parser import ChangelogParser, get_changelog_parser
 from codeshift.knowledge.sources import SourceFetcher, get_source_fetcher
+from codeshift.knowledge_base.models import TIER_1_LIBRARIES
 
 
 class KnowledgeGenerator:
@@ -161,26 +162,6 @@ class KnowledgeGenerator:
         return Confidence.LOW
 
 
-# Tier 1 libraries with deterministic AST transforms
-TIER_1_LIBRARIES = {
-    "pydantic",
-    "fastapi",
-    "sqlalchemy",
-    "pandas",
-    "requests",
-    "numpy",
-    "pytest",
-    "marshmallow",
-    "flask",
-    "celery",
-    "httpx",
-    "aiohttp",
-    "click",
-    "attrs",
-    "django",
-}
-
-
 def is_tier_1_library(library: str) -> bool:
     """Check if a library is Tier 1 (has deterministic transforms).
 
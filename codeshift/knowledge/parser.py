@@ -12,6 +12,12 @@ from codeshift.knowledge.models import (
 )
 from codeshift.utils.llm_client import LLMClient, get_llm_client
 
+# Fenced code block, optionally tagged as json
+CODE_BLOCK_PATTERN = re.compile(r"```(?:json)?\s*([\s\S]*?)```")
+
+# Bare JSON array
+JSON_ARRAY_PATTERN = re.compile(r"\[[\s\S]*?\]")
+
 
 class ChangelogParser:
     """Parses changelog content using LLM to extract breaking changes."""
@@ -125,27 +131,22 @@ Extract breaking changes as a JSON array:"""
         Returns:
             Merged list of breaking changes (duplicates removed).
         """
-        all_changes: list[BreakingChange] = []
-        seen_apis: set[str] = set()
+        # Index merged changes by old_api so duplicates resolve in O(1)
+        changes_by_api: dict[str, BreakingChange] = {}
 
         for source in sources:
             changes = self.parse_changelog(source, package, from_version, to_version)
 
             for change in changes:
-                # Deduplicate by old_api
-                if change.old_api not in seen_apis:
-                    seen_apis.add(change.old_api)
-                    all_changes.append(change)
-                else:
+                existing = changes_by_api.get(change.old_api)
+                if existing is None:
+                    changes_by_api[change.old_api] = change
+                elif change.confidence > existing.confidence:
                     # Update confidence if we find the same change in a better source
-                    for existing in all_changes:
-                        if existing.old_api == change.old_api:
-                            if change.confidence > existing.confidence:
-                                existing.confidence = change.confidence
-                                existing.source = change.source
-                            break
+                    existing.confidence = change.confidence
+                    existing.source = change.source
 
-        return all_changes
+        return list(changes_by_api.values())
 
     def _parse_response(
         self,
@@ -225,16 +226,14 @@ Extract breaking changes as a JSON array:"""
                         return content[: i + 1]
 
         # Try to find JSON in code blocks
-        code_block_pattern = r"```(?:json)?\s*([\s\S]*?)```"
-        matches = re.findall(code_block_pattern, content)
+        matches = CODE_BLOCK_PATTERN.findall(content)
         for match in matches:
             match_str = cast(str, match).strip()
             if match_str.startswith("["):
                 return match_str
 
         # Try to find bare JSON array
-        array_pattern = r"\[[\s\S]*?\]"
-        matches = re.findall(array_pattern, content)
+        matches = JSON_ARRAY_PATTERN.findall(content)
         if matches:
             # Return the longest match (likely the full array)
             return cast(str, max(matches, key=len))
@@ -1,13 +1,27 @@
 """Source fetchers for changelog and migration guide discovery."""
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from urllib.parse import urlparse
 
 import httpx
 
 from codeshift.knowledge.models import ChangelogSource
 
+# Maximum number of candidate files probed on GitHub at once
+MAX_FETCH_WORKERS = 8
+
+# Common changelog version header patterns, matched at the start of any line.
+# Whitespace inside a header is [^\S\n] so a match never spans two lines.
+VERSION_HEADER_PATTERN = re.compile(
+    r"^#+[^\S\n]*\[?v?(\d+\.\d+(?:\.\d+)?)\]?|"  # ## [1.0.0] or ## v1.0.0
+    r"^v?(\d+\.\d+(?:\.\d+)?)[^\S\n]*[-–—]|"  # 1.0.0 - or v1.0.0 -
+    r"^v?(\d+\.\d+(?:\.\d+)?)[^\S\n]*\(",  # 1.0.0 (date)
+    re.IGNORECASE | re.MULTILINE,
+)
+
 
 @dataclass
 class PackageInfo:
@@ -162,14 +176,14 @@ class SourceFetcher:
         Returns:
             ChangelogSource or None if not found.
         """
-        for filename in self.CHANGELOG_FILENAMES:
-            content = self.fetch_github_file(repo_url, filename)
-            if content:
-                return ChangelogSource(
-                    url=f"{repo_url}/blob/main/{filename}",
-                    source_type="changelog",
-                    content=content,
-                )
+        found = self._fetch_first_github_file(repo_url, self.CHANGELOG_FILENAMES)
+        if found:
+            filename, content = found
+            return ChangelogSource(
+                url=f"{repo_url}/blob/main/{filename}",
+                source_type="changelog",
+                content=content,
+            )
         return None
 
     def fetch_migration_guide(self, repo_url: str) -> ChangelogSource | None:
@@ -181,19 +195,51 @@ class SourceFetcher:
         Returns:
             ChangelogSource or None if not found.
         """
-        for pattern in self.MIGRATION_GUIDE_PATTERNS:
-            # Try common file extensions
-            for ext in [".md", ".rst", ".txt", ""]:
-                path = (
-                    f"{pattern}{ext}" if not pattern.endswith((".md", ".rst", ".txt")) else pattern
-                )
-                content = self.fetch_github_file(repo_url, path)
-                if content:
-                    return ChangelogSource(
-                        url=f"{repo_url}/blob/main/{path}",
-                        source_type="migration_guide",
-                        content=content,
-                    )
+        # Try common file extensions; dict.fromkeys drops repeats while keeping order
+        paths = dict.fromkeys(
+            f"{pattern}{ext}" if not pattern.endswith((".md", ".rst", ".txt")) else pattern
+            for pattern in self.MIGRATION_GUIDE_PATTERNS
+            for ext in [".md", ".rst", ".txt", ""]
+        )
+        found = self._fetch_first_github_file(repo_url, list(paths))
+        if found:
+            path, content = found
+            return ChangelogSource(
+                url=f"{repo_url}/blob/main/{path}",
+                source_type="migration_guide",
+                content=content,
+            )
+        return None
+
+    def _fetch_first_github_file(
+        self, repo_url: str, file_paths: list[str]
+    ) -> tuple[str, str] | None:
+        """Fetch the first file in preference order that exists in a repository.
+
+        The most preferred candidate is probed on its own, then the rest in
+        windows of up to ``MAX_FETCH_WORKERS`` concurrent requests over the shared
+        client. Each window finishes before the call moves on or returns.
+
+        Args:
+            repo_url: GitHub repository URL.
+            file_paths: Candidate paths, most preferred first.
+
+        Returns:
+            Tuple of (path, content) or None if no candidate was found.
+        """
+        windows = [file_paths[:1]] + [
+            file_paths[i : i + MAX_FETCH_WORKERS]
+            for i in range(1, len(file_paths), MAX_FETCH_WORKERS)
+        ]
+
+        # Build the lazy client up front so worker threads don't race to create it
+        _ = self.client
+        with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+            for window in windows:
+                contents = executor.map(partial(self.fetch_github_file, repo_url), window)
+                for path, content in zip(window, contents, strict=True):
+                    if content:
+                        return path, content
         return None
 
     def fetch_release_notes(self, repo_url: str, version: str) -> ChangelogSource | None:
@@ -321,39 +367,29 @@ class SourceFetcher:
         Returns:
             Extracted changelog content for the version range.
         """
-        lines = changelog_content.split("\n")
-        result_lines = []
-        in_range = False
-        found_start = False
-
-        # Common version header patterns
-        version_pattern = re.compile(
-            r"^#+\s*\[?v?(\d+\.\d+(?:\.\d+)?)\]?|"  # ## [1.0.0] or ## v1.0.0
-            r"^v?(\d+\.\d+(?:\.\d+)?)\s*[-–—]|"  # 1.0.0 - or v1.0.0 -
-            r"^v?(\d+\.\d+(?:\.\d+)?)\s*\(",  # 1.0.0 (date)
-            re.IGNORECASE,
-        )
-
-        for line in lines:
-            match = version_pattern.match(line)
-            if match:
-                # Extract version number
-                version = match.group(1) or match.group(2) or match.group(3)
-                if version:
-                    # Check if this is our target version or later
-                    if self._compare_versions(version, to_version) <= 0:
-                        if not found_start:
-                            in_range = True
-                            found_start = True
-
-                    # Check if we've gone past the from_version
-                    if self._compare_versions(version, from_version) < 0:
-                        in_range = False
-
-            if in_range:
-                result_lines.append(line)
-
-        return "\n".join(result_lines)
+        # Scan headers across the whole text instead of looping over lines. The
+        # range starts at the first header at or below to_version and ends just
+        # before the first header (from there on) below from_version.
+        start: int | None = None
+        for match in VERSION_HEADER_PATTERN.finditer(changelog_content):
+            version = match.group(1) or match.group(2) or match.group(3)
+            if not version:
+                continue
+
+            if start is None:
+                # Check if this is our target version or later
+                if self._compare_versions(version, to_version) > 0:
+                    continue
+                start = match.start()
+
+            # Check if we've gone past the from_version (dropping the newline
+            # that ends the previous line)
+            if self._compare_versions(version, from_version) < 0:
+                return changelog_content[start : max(start, match.start() - 1)]
+
+        if start is None:
+            return ""
+        return changelog_content[start:]
 
     def _compare_versions(self, v1: str, v2: str) -> int:
         """Compare two version strings.
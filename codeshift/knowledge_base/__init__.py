@@ -2,6 +2,7 @@
 
 from codeshift.knowledge_base.loader import KnowledgeBaseLoader
 from codeshift.knowledge_base.models import (
+    TIER_1_LIBRARIES,
     BreakingChange,
     ChangeType,
     LibraryKnowledge,
@@ -14,4 +15,5 @@ __all__ = [
     "ChangeType",
     "Severity",
     "LibraryKnowledge",
+    "TIER_1_LIBRARIES",
 ]
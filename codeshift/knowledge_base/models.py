@@ -3,6 +3,27 @@
 from dataclasses import dataclass, field
 from enum import Enum
 
+# Tier 1 libraries with deterministic AST transforms
+TIER_1_LIBRARIES = frozenset(
+    {
+        "pydantic",
+        "fastapi",
+        "sqlalchemy",
+        "pandas",
+        "requests",
+        "numpy",
+        "pytest",
+        "marshmallow",
+        "flask",
+        "celery",
+        "httpx",
+        "aiohttp",
+        "click",
+        "attrs",
+        "django",
+    }
+)
+
 
 class ChangeType(Enum):
     """Types of breaking changes."""
@@ -16,7 +16,7 @@ class TransformStatus(Enum):
     NO_CHANGES = "no_changes"
 
 
-@dataclass
+@dataclass(slots=True)
 class TransformChange:
     """Represents a single code change made by a transform."""
 
@@ -16,6 +16,14 @@ from codeshift.utils.api_client import CodeshiftAPIClient, get_api_client
 from codeshift.utils.cache import LLMCache, get_llm_cache
 from codeshift.validator.syntax_checker import quick_syntax_check
 
+# Common fixes for syntax issues in LLM output, applied in order
+SYNTAX_FIXES: list[tuple[re.Pattern[str], str]] = [
+    # Remove trailing incomplete lines
+    (re.compile(r"\n\s*$"), "\n"),
+    # Fix unclosed strings (simple cases)
+    (re.compile(r'(["\'])([^"\'\n]*?)$'), r"\1\2\1"),
+]
+
 
 @dataclass
 class LLMMigrationResult:
@@ -166,17 +174,9 @@ class LLMMigrator:
         Returns:
             Fixed code (or original if unfixable)
         """
-        # Common fixes
-        fixes = [
-            # Remove trailing incomplete lines
-            (r"\n\s*$", "\n"),
-            # Fix unclosed strings (simple cases)
-            (r'(["\'])([^"\'\n]*?)$', r"\1\2\1"),
-        ]
-
         fixed = code
-        for pattern, replacement in fixes:
-            fixed = re.sub(pattern, replacement, fixed)
+        for pattern, replacement in SYNTAX_FIXES:
+            fixed = pattern.sub(replacement, fixed)
 
         return fixed
 
@@ -18,7 +18,7 @@ PACKAGE_IMPORT_ALIASES: dict[str, list[str]] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportInfo:
     """Information about an import statement."""
 
@@ -40,7 +40,7 @@ class ImportInfo:
         return f"import {self.module}"
 
 
-@dataclass
+@dataclass(slots=True)
 class UsageInfo:
     """Information about a symbol usage."""
 
@@ -338,10 +338,8 @@ class CodeScanner:
         """
         result = ScanResult()
 
-        # Find all Python files
-        python_files = list(directory.rglob("*.py"))
-
-        for file_path in python_files:
+        # Walk Python files lazily rather than materialising the full listing
+        for file_path in directory.rglob("*.py"):
             # Check exclude patterns
             relative_path = str(file_path.relative_to(directory))
             if self._should_exclude(relative_path):
@@ -1,5 +1,6 @@
 """Parser for dependency files (requirements.txt, pyproject.toml)."""
 
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -9,6 +10,15 @@ from packaging.requirements import Requirement
 from packaging.specifiers import SpecifierSet
 from packaging.version import Version
 
+# install_requires = [...] list in setup.py
+INSTALL_REQUIRES_PATTERN = re.compile(r"install_requires\s*=\s*\[(.*?)\]", re.DOTALL)
+
+# Quoted string literal
+QUOTED_STRING_PATTERN = re.compile(r"['\"]([^'\"]+)['\"]")
+
+# Fallback "name<spec>" split for requirement strings packaging cannot parse
+BASIC_REQUIREMENT_PATTERN = re.compile(r"([a-zA-Z0-9_-]+)(.*)")
+
 
 @dataclass
 class Dependency:
@@ -206,13 +216,11 @@ class DependencyParser:
         dependencies = []
 
         # Look for install_requires = [...] pattern
-        import re
-
-        match = re.search(r"install_requires\s*=\s*\[(.*?)\]", content, re.DOTALL)
+        match = INSTALL_REQUIRES_PATTERN.search(content)
         if match:
             deps_str = match.group(1)
             # Extract quoted strings
-            for dep_match in re.finditer(r"['\"]([^'\"]+)['\"]", deps_str):
+            for dep_match in QUOTED_STRING_PATTERN.finditer(deps_str):
                 dep = self._parse_requirement_string(dep_match.group(1))
                 if dep:
                     dep.source_file = setup_path
@@ -254,9 +262,7 @@ class DependencyParser:
             )
         except Exception:
             # Try basic parsing
-            import re
-
-            match = re.match(r"([a-zA-Z0-9_-]+)(.*)", req_str)
+            match = BASIC_REQUIREMENT_PATTERN.match(req_str)
             if match:
                 return Dependency(
                     name=match.group(1),
@@ -358,8 +364,6 @@ class DependencyParser:
         Returns:
             True if update was successful.
         """
-        import re
-
         pyproject_path = self.project_path / "pyproject.toml"
         if not pyproject_path.exists():
             return False
@@ -408,8 +412,6 @@ class DependencyParser:
         Returns:
             True if update was successful.
         """
-        import re
-
         requirements_path = self.project_path / "requirements.txt"
         if not requirements_path.exists():
             return False
@@ -447,8 +449,6 @@ class DependencyParser:
         Returns:
             True if update was successful.
         """
-        import re
-
         setup_path = self.project_path / "setup.py"
         if not setup_path.exists():
             return False
@@ -8,9 +8,12 @@ from pathlib import Path
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
-    """A cached entry with metadata."""
+    """A cached entry with metadata.
+
+    ``hits`` counts reads in this process only and is not persisted.
+    """
 
     key: str
     value: Any
@@ -70,8 +73,8 @@ class Cache:
             The cached value or None if not found/expired
         """
         # Check memory cache first
-        if key in self._memory_cache:
-            entry = self._memory_cache[key]
+        entry = self._memory_cache.get(key)
+        if entry is not None:
             if not entry.is_expired:
                 entry.hits += 1
                 return entry.value
@@ -88,21 +91,17 @@ class Cache:
                     value=data["value"],
                     created_at=data["created_at"],
                     expires_at=data.get("expires_at"),
-                    hits=data.get("hits", 0),
                 )
 
                 if entry.is_expired:
                     cache_path.unlink()
                     return None
 
-                # Store in memory cache
+                # Store in memory cache; hit counts are only tracked in memory so
+                # reads never rewrite the cache file
                 entry.hits += 1
                 self._memory_cache[key] = entry
 
-                # Update file with new hit count
-                data["hits"] = entry.hits
-                cache_path.write_text(json.dumps(data))
-
                 return entry.value
 
             except (json.JSONDecodeError, KeyError):
@@ -132,7 +131,6 @@ class Cache:
             value=value,
             created_at=now,
             expires_at=expires_at,
-            hits=0,
         )
 
         # Store in memory
@@ -147,7 +145,6 @@ class Cache:
                     "value": entry.value,
                     "created_at": entry.created_at,
                     "expires_at": entry.expires_at,
-                    "hits": entry.hits,
                 }
             )
         )
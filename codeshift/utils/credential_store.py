@@ -90,6 +90,9 @@ class CredentialStore:
         self.legacy_path = self.config_dir / self.LEGACY_CREDENTIALS_FILE
         self.salt_path = self.config_dir / self.SALT_FILE
 
+        # Derived keys by salt, so PBKDF2 runs at most once per salt per process
+        self._key_cache: dict[bytes, bytes] = {}
+
         # Check if cryptography is available
         if not CRYPTOGRAPHY_AVAILABLE:
             logger.warning(
@@ -162,7 +165,7 @@ class CredentialStore:
                 except Exception:
                     pass
         except Exception as e:
-            logger.debug(f"Could not get hardware UUID: {e}")
+            logger.debug("Could not get hardware UUID: %s", e)
 
         # Fallback to UUID based on hostname (less stable but better than nothing)
         if len(components) < 4:
@@ -184,7 +187,7 @@ class CredentialStore:
             try:
                 return self.salt_path.read_bytes()
             except OSError as e:
-                logger.warning(f"Could not read salt file: {e}")
+                logger.warning("Could not read salt file: %s", e)
 
         # Generate new salt
         salt = secrets.token_bytes(32)
@@ -199,7 +202,8 @@ class CredentialStore:
     def _derive_key(self, salt: bytes) -> bytes:
         """Derive an encryption key from the machine identifier.
 
-        Uses PBKDF2-SHA256 with 100,000 iterations for key derivation.
+        Uses PBKDF2-SHA256 with 100,000 iterations for key derivation. The
+        result is cached per salt for the lifetime of the store.
 
         Args:
             salt: Random salt for key derivation.
@@ -213,6 +217,10 @@ class CredentialStore:
                 "Install with: pip install cryptography"
             )
 
+        cached_key = self._key_cache.get(salt)
+        if cached_key is not None:
+            return cached_key
+
         machine_id = self._get_machine_identifier()
 
         kdf = PBKDF2HMAC(
@@ -223,8 +231,9 @@ class CredentialStore:
             backend=default_backend(),
         )
 
-        key = kdf.derive(machine_id.encode())
-        return base64.urlsafe_b64encode(key)
+        key = base64.urlsafe_b64encode(kdf.derive(machine_id.encode()))
+        self._key_cache[salt] = key
+        return key
 
     def _encrypt(self, data: dict) -> bytes:
         """Encrypt credential data.
@@ -315,7 +324,7 @@ class CredentialStore:
                 ciphertext = self.credentials_path.read_bytes()
                 return self._decrypt(ciphertext)
             except OSError as e:
-                logger.error(f"Could not read credentials file: {e}")
+                logger.error("Could not read credentials file: %s", e)
                 return None
 
         # Check for legacy plaintext credentials and migrate
@@ -333,7 +342,7 @@ class CredentialStore:
 
                 return credentials
             except (OSError, json.JSONDecodeError) as e:
-                logger.warning(f"Could not migrate legacy credentials: {e}")
+                logger.warning("Could not migrate legacy credentials: %s", e)
                 return None
 
         return None
@@ -351,6 +360,7 @@ class CredentialStore:
         # Delete salt file
         if self.salt_path.exists():
             self._secure_delete(self.salt_path)
+        self._key_cache.clear()
 
         logger.debug("Credentials deleted")
 
@@ -373,7 +383,7 @@ class CredentialStore:
                 # Then delete
                 path.unlink()
         except OSError as e:
-            logger.warning(f"Could not securely delete {path}: {e}")
+            logger.warning("Could not securely delete %s: %s", path, e)
             # Try regular delete as fallback
             try:
                 path.unlink()
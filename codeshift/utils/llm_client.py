@@ -17,6 +17,36 @@ __all__: list[str] = []
 
 logger = logging.getLogger(__name__)
 
+# System prompt for code migrations, filled in with str.format per request
+MIGRATION_SYSTEM_PROMPT_TEMPLATE = """You are an expert Python developer specializing in code migrations.
+Your task is to migrate Python code from {library} v{from_version} to v{to_version}.
+
+Guidelines:
+1. Only modify code that needs to change for the migration
+2. Preserve all comments, formatting, and code style where possible
+3. Add brief inline comments explaining non-obvious changes
+4. If you're unsure about a change, add a TODO comment
+5. Return ONLY the migrated code, no explanations before or after
+
+Important {library} v{from_version} to v{to_version} changes:
+- Config class -> model_config = ConfigDict(...)
+- @validator -> @field_validator with @classmethod
+- @root_validator -> @model_validator with @classmethod
+- .dict() -> .model_dump()
+- .json() -> .model_dump_json()
+- .schema() -> .model_json_schema()
+- .parse_obj() -> .model_validate()
+- .parse_raw() -> .model_validate_json()
+- .copy() -> .model_copy()
+- orm_mode -> from_attributes
+- Field(regex=...) -> Field(pattern=...)
+"""
+
+# System prompt for explaining a migration change
+EXPLAIN_SYSTEM_PROMPT = """You are an expert Python developer.
+Explain code changes clearly and concisely for other developers.
+Focus on the 'why' not just the 'what'."""
+
 
 class DirectLLMAccessError(Exception):
     """Raised when code attempts to bypass the Codeshift API and access LLM directly.
@@ -215,29 +245,9 @@ class _LLMClient:
         Returns:
             LLMResponse with the migrated code
         """
-        system_prompt = f"""You are an expert Python developer specializing in code migrations.
-Your task is to migrate Python code from {library} v{from_version} to v{to_version}.
-
-Guidelines:
-1. Only modify code that needs to change for the migration
-2. Preserve all comments, formatting, and code style where possible
-3. Add brief inline comments explaining non-obvious changes
-4. If you're unsure about a change, add a TODO comment
-5. Return ONLY the migrated code, no explanations before or after
-
-Important {library} v{from_version} to v{to_version} changes:
-- Config class -> model_config = ConfigDict(...)
-- @validator -> @field_validator with @classmethod
-- @root_validator -> @model_validator with @classmethod
-- .dict() -> .model_dump()
-- .json() -> .model_dump_json()
-- .schema() -> .model_json_schema()
-- .parse_obj() -> .model_validate()
-- .parse_raw() -> .model_validate_json()
-- .copy() -> .model_copy()
-- orm_mode -> from_attributes
-- Field(regex=...) -> Field(pattern=...)
-"""
+        system_prompt = MIGRATION_SYSTEM_PROMPT_TEMPLATE.format(
+            library=library, from_version=from_version, to_version=to_version
+        )
 
         prompt = f"""Migrate the following Python code from {library} v{from_version} to v{to_version}.
 
@@ -268,10 +278,6 @@ Return only the migrated Python code:"""
         Returns:
             LLMResponse with the explanation
         """
-        system_prompt = """You are an expert Python developer.
-Explain code changes clearly and concisely for other developers.
-Focus on the 'why' not just the 'what'."""
-
         prompt = f"""Explain the following {library} migration change:
 
 Original:
@@ -286,7 +292,7 @@ Migrated:
 
 Provide a brief explanation (2-3 sentences) of what changed and why:"""
 
-        return self.generate(prompt, system_prompt=system_prompt, max_tokens=500)
+        return self.generate(prompt, system_prompt=EXPLAIN_SYSTEM_PROMPT, max_tokens=500)
 
 
 # Keep backward compatibility alias but mark as deprecated
@@ -0,0 +1,42 @@
+"""Concurrent lookups against the PyPI JSON API."""
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+# Upper bound on concurrent PyPI requests
+MAX_PYPI_WORKERS = 8
+
+
+def map_pypi_lookups(
+    fetch: Callable[[str, httpx.Client], T],
+    packages: list[str],
+    timeout: float,
+) -> Iterator[T]:
+    """Run a PyPI lookup for each package concurrently.
+
+    Lookups are network-bound, so they run on a bounded thread pool and share
+    one pooled HTTP client to reuse connections to pypi.org.
+
+    Args:
+        fetch: Callable taking a package name and the shared client.
+        packages: Package names to look up.
+        timeout: HTTP request timeout in seconds.
+
+    Yields:
+        The result of ``fetch`` for each package, in input order.
+    """
+    if not packages:
+        return
+
+    max_workers = min(MAX_PYPI_WORKERS, len(packages))
+    with (
+        httpx.Client(timeout=timeout) as client,
+        ThreadPoolExecutor(max_workers=max_workers) as executor,
+    ):
+        yield from executor.map(fetch, packages, repeat(client))
@@ -56,11 +56,10 @@ class SyntaxChecker:
             SyntaxCheckResult with validation status
         """
         try:
-            # First, try to compile the code
-            compile(source_code, filename, "exec")
-
-            # Then parse with AST for more detailed checking
-            ast.parse(source_code, filename=filename)
+            # Parse once, then compile the tree to catch compiler-level errors
+            # (e.g. 'return' outside function) without re-parsing the source
+            tree = ast.parse(source_code, filename=filename)
+            compile(tree, filename, "exec")
 
             return SyntaxCheckResult(is_valid=True)
 
@@ -6,6 +6,9 @@ import sys
 from dataclasses import dataclass
 from pathlib import Path
 
+# Shell metacharacters rejected in any user-supplied test argument or path
+SHELL_METACHAR_PATTERN = re.compile(r"[;|&$`\\'\"\n\r]")
+
 
 @dataclass
 class TestResult:
@@ -33,18 +36,21 @@ class TestResult:
 class TestRunner:
     """Runs project tests to validate migrations."""
 
-    # Allowed argument patterns for test runner extra_args
-    _SAFE_ARG_PATTERNS = [
-        re.compile(r"^-[vqsx]$"),  # Single-char flags
-        re.compile(r"^--tb=(short|long|line|no|auto)$"),  # Traceback style
-        re.compile(r"^--maxfail=\d+$"),  # Max failures
-        re.compile(r"^--(collect-only|co)$"),  # Collection only
-        re.compile(r"^--import-mode=(prepend|append|importlib)$"),  # Import mode
-        re.compile(r"^-k\s?.+$"),  # Test selection expression
-        re.compile(r"^-m\s?.+$"),  # Marker expression
-        re.compile(r"^--no-header$"),  # Suppress header
-        re.compile(r"^--timeout=\d+$"),  # Timeout
-    ]
+    # Allowed argument patterns for test runner extra_args, fused into a single
+    # anchored alternation so each argument is matched in one pass
+    _SAFE_ARG_PATTERN = re.compile(
+        r"^(?:"
+        r"-[vqsx]"  # Single-char flags
+        r"|--tb=(?:short|long|line|no|auto)"  # Traceback style
+        r"|--maxfail=\d+"  # Max failures
+        r"|--(?:collect-only|co)"  # Collection only
+        r"|--import-mode=(?:prepend|append|importlib)"  # Import mode
+        r"|-k\s?.+"  # Test selection expression
+        r"|-m\s?.+"  # Marker expression
+        r"|--no-header"  # Suppress header
+        r"|--timeout=\d+"  # Timeout
+        r")$"
+    )
 
     def __init__(
         self,
@@ -93,10 +99,10 @@ class TestRunner:
         validated = []
         for arg in extra_args:
             # Reject args containing shell metacharacters
-            if any(c in arg for c in ";|&$`\\'\"\n\r"):
+            if SHELL_METACHAR_PATTERN.search(arg):
                 continue
             # Check against safe patterns
-            if any(pattern.match(arg) for pattern in cls._SAFE_ARG_PATTERNS):
+            if cls._SAFE_ARG_PATTERN.match(arg):
                 validated.append(arg)
         return validated
 
@@ -114,7 +120,7 @@ class TestRunner:
         validated = []
         for test in specific_tests:
             # Reject anything with shell metacharacters
-            if any(c in test for c in ";|&$`\\'\"\n\r"):
+            if SHELL_METACHAR_PATTERN.search(test):
                 continue
             # Resolve and check it's within the project
             resolved = (project_path / test).resolve()
@@ -0,0 +1,43 @@
+"""Tests for the file-based cache."""
+
+import json
+from pathlib import Path
+
+from codeshift.utils.cache import Cache
+
+
+class TestCache:
+    """Tests for Cache."""
+
+    def test_file_cache_hit_does_not_rewrite_file(self, tmp_path: Path) -> None:
+        """Test that reading an entry from disk leaves the cache file untouched."""
+        Cache(cache_dir=tmp_path).set("key", {"answer": 42})
+        cache_path = tmp_path / "key.json"
+        before = (cache_path.read_bytes(), cache_path.stat().st_mtime_ns)
+
+        # A fresh instance has an empty memory cache, so both reads go to disk first
+        cache = Cache(cache_dir=tmp_path)
+        assert cache.get("key") == {"answer": 42}
+        assert cache.get("key") == {"answer": 42}
+
+        assert (cache_path.read_bytes(), cache_path.stat().st_mtime_ns) == before
+        assert cache.stats()["total_hits"] == 2
+
+    def test_hits_are_not_persisted(self, tmp_path: Path) -> None:
+        """Test that the on-disk entry has no hit count field."""
+        Cache(cache_dir=tmp_path).set("key", "value")
+
+        data = json.loads((tmp_path / "key.json").read_text())
+
+        assert "hits" not in data
+        assert data["value"] == "value"
+
+    def test_expired_file_entry_is_removed(self, tmp_path: Path) -> None:
+        """Test that an expired entry on disk is deleted on read."""
+        cache_path = tmp_path / "key.json"
+        cache_path.write_text(
+            json.dumps({"key": "key", "value": "old", "created_at": 0.0, "expires_at": 1.0})
+        )
+
+        assert Cache(cache_dir=tmp_path).get("key") is None
+        assert not cache_path.exists()
@@ -1,6 +1,7 @@
 """Tests for the codebase health scoring feature."""
 
 import json
+import warnings
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -328,6 +329,16 @@ class TestMigrationReadinessCalculator:
         result = calc.calculate(tmp_path, dependencies=deps)
         assert result.score == 100
 
+    def test_analyze_dependencies_uses_tier1_registry(self, tmp_path: Path) -> None:
+        """Test that Tier 1 detection follows the shared Tier 1 library registry."""
+        (tmp_path / "pyproject.toml").write_text(
+            '[project]\nname = "test"\ndependencies = ["Django>=4.0", "left-pad>=1.0"]\n'
+        )
+        calc = MigrationReadinessCalculator()
+        deps = {d.name: d for d in calc._analyze_dependencies(tmp_path)}
+        assert deps["Django"].has_tier1_support
+        assert not deps["left-pad"].has_tier1_support
+
     def test_calculate_mixed_support(self, tmp_path: Path) -> None:
         """Test with mixed support levels."""
         deps = [
@@ -411,6 +422,32 @@ def typed_func(x: int) -> str:
         # 100% typed (70 pts) + 100% documented (30 pts) = 100
         assert result.score == 100
 
+    def test_calculate_does_not_emit_syntax_warnings(self, tmp_path: Path) -> None:
+        """Test that invalid escape sequences in analyzed code stay silent."""
+        py_file = tmp_path / "example.py"
+        py_file.write_text(
+            'import re\n\ndef strip_digits(s: str) -> str:\n    return re.sub("\\d", "", s)\n'
+        )
+
+        calc = DocumentationCalculator()
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            result = calc.calculate(tmp_path)
+
+        assert caught == []
+        assert result.details["function_count"] == 1
+
+    def test_one_line_docstring_counts_as_documented(self, tmp_path: Path) -> None:
+        """Test that a docstring on the def line counts, as it does for __doc__."""
+        py_file = tmp_path / "example.py"
+        py_file.write_text('def one_liner(): "Docstring."\n\ndef undocumented(): pass\n')
+
+        calc = DocumentationCalculator()
+        result = calc.calculate(tmp_path)
+
+        assert result.details["function_count"] == 2
+        assert result.details["documented_count"] == 1
+
     def test_calculate_with_untyped_function(self, tmp_path: Path) -> None:
         """Test with untyped function."""
         py_file = tmp_path / "example.py"
@@ -425,6 +462,18 @@ def typed_func(x: int) -> str:
         # 0% typed + 0% documented = 0
         assert result.score == 0
 
+    def test_calculate_skips_excluded_directories(self, tmp_path: Path) -> None:
+        """Test that files in virtualenvs and build directories are ignored."""
+        (tmp_path / "example.py").write_text("def typed_func(x: int) -> str:\n    return str(x)\n")
+        venv_dir = tmp_path / ".venv" / "lib"
+        venv_dir.mkdir(parents=True)
+        (venv_dir / "untyped.py").write_text("def untyped_func(x):\n    return x\n")
+
+        calc = DocumentationCalculator()
+        result = calc.calculate(tmp_path)
+        assert result.details["file_count"] == 1
+        assert result.details["typed_count"] == 1
+
 
 # ==============================================================================
 # Calculator Integration Tests
@@ -460,6 +509,34 @@ dependencies = []
         assert score.grade in list(HealthGrade)
         assert len(score.metrics) == 5
 
+    @patch("httpx.Client.get")
+    def test_analyze_dependencies_preserves_order(
+        self, mock_get: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that concurrent PyPI lookups are matched back to their dependency."""
+        latest = {"requests": "2.31.0", "click": "8.1.7", "rich": "13.7.0"}
+
+        def fake_get(url: str) -> MagicMock:
+            name = url.split("/")[-2]
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {"info": {"version": latest[name]}}
+            return response
+
+        mock_get.side_effect = fake_get
+        (tmp_path / "pyproject.toml").write_text(
+            '[project]\nname = "test"\n'
+            'dependencies = ["requests>=2.0", "click>=8.0", "rich>=13.0"]\n'
+        )
+
+        deps = HealthCalculator()._analyze_dependencies(tmp_path)
+
+        assert [(d.name, d.latest_version) for d in deps] == [
+            ("requests", "2.31.0"),
+            ("click", "8.1.7"),
+            ("rich", "13.7.0"),
+        ]
+
 
 # ==============================================================================
 # Report Tests
@@ -0,0 +1,124 @@
+"""Tests for changelog source fetching and extraction."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from codeshift.knowledge.sources import SourceFetcher
+
+CHANGELOG = """# Changelog
+
+## 3.0.0
+- three
+
+## 2.0.0
+- two
+
+## 1.5.0
+- one five
+
+## 1.0.0
+- one
+"""
+
+
+class TestExtractVersionChangelog:
+    """Tests for SourceFetcher.extract_version_changelog."""
+
+    @pytest.fixture
+    def fetcher(self) -> SourceFetcher:
+        return SourceFetcher()
+
+    def test_range_in_middle(self, fetcher: SourceFetcher) -> None:
+        """Test that extraction stops before the first header below from_version."""
+        result = fetcher.extract_version_changelog(CHANGELOG, "1.5.0", "2.0.0")
+        assert result == "## 2.0.0\n- two\n\n## 1.5.0\n- one five\n"
+
+    def test_range_to_eof_with_trailing_newline(self, fetcher: SourceFetcher) -> None:
+        """Test a range that runs to the end of the file."""
+        result = fetcher.extract_version_changelog(CHANGELOG, "0.1", "1.5.0")
+        assert result == "## 1.5.0\n- one five\n\n## 1.0.0\n- one\n"
+
+    def test_range_to_eof_without_trailing_newline(self, fetcher: SourceFetcher) -> None:
+        """Test a range that runs to the end of a file with no final newline."""
+        result = fetcher.extract_version_changelog(CHANGELOG.rstrip("\n"), "0.1", "1.5.0")
+        assert result == "## 1.5.0\n- one five\n\n## 1.0.0\n- one"
+
+    def test_first_header_below_from_version(self, fetcher: SourceFetcher) -> None:
+        """Test that nothing is extracted when every version predates the range."""
+        content = "## 1.0.0\n- old\n## 0.9.0\n- older\n"
+        assert fetcher.extract_version_changelog(content, "2.0.0", "3.0.0") == ""
+
+    def test_crlf_line_endings(self, fetcher: SourceFetcher) -> None:
+        """Test that CRLF input is sliced on the same header boundaries."""
+        content = CHANGELOG.replace("\n", "\r\n")
+        result = fetcher.extract_version_changelog(content, "1.5.0", "2.0.0")
+        assert result == "## 2.0.0\r\n- two\r\n\r\n## 1.5.0\r\n- one five\r\n\r"
+
+    def test_header_does_not_span_lines(self, fetcher: SourceFetcher) -> None:
+        """Test that a bare version followed by a bullet line is not a header."""
+        content = "2.0\n- not a header\n1.0 - real\n- x\n"
+        assert fetcher.extract_version_changelog(content, "1.0", "2.0") == "1.0 - real\n- x\n"
+
+
+class TestFetchFirstGithubFile:
+    """Tests for SourceFetcher._fetch_first_github_file."""
+
+    def test_earliest_candidate_wins(self) -> None:
+        """Test that preference order wins over completion order."""
+        # Candidates are probed as ["a"], then "b".."i" together. "b" and "e"
+        # both exist in that window; "b" is preferred but answers after "e", and
+        # the missing "c" is still running when "b" answers
+        delays = dict.fromkeys("abcdefghij", 0.0)
+        delays["b"] = 0.05
+        delays["c"] = 0.1
+        lock = threading.Lock()
+        calls: list[str] = []
+        running = 0
+
+        def fake_fetch(repo_url: str, file_path: str) -> str | None:
+            nonlocal running
+            with lock:
+                calls.append(file_path)
+                running += 1
+            time.sleep(delays[file_path])
+            with lock:
+                running -= 1
+            return f"content of {file_path}" if file_path in ("b", "e") else None
+
+        fetcher = SourceFetcher()
+        with patch.object(fetcher, "fetch_github_file", side_effect=fake_fetch):
+            result = fetcher._fetch_first_github_file(
+                "https://github.com/owner/repo", list("abcdefghij")
+            )
+            assert running == 0
+            probes_at_return = len(calls)
+            time.sleep(0.05)
+
+        assert result == ("b", "content of b")
+        assert len(calls) == probes_at_return
+        fetcher.close()
+
+    def test_first_candidate_found_makes_one_request(self) -> None:
+        """Test that the common case probes only the most preferred candidate."""
+        fetcher = SourceFetcher()
+        with patch.object(fetcher, "fetch_github_file", return_value="# Changelog") as mock_fetch:
+            changelog = fetcher.fetch_changelog("https://github.com/owner/repo")
+
+        assert changelog is not None
+        assert changelog.url == "https://github.com/owner/repo/blob/main/CHANGELOG.md"
+        mock_fetch.assert_called_once_with("https://github.com/owner/repo", "CHANGELOG.md")
+        fetcher.close()
+
+    def test_no_candidate_found(self) -> None:
+        """Test that None is returned when no candidate exists."""
+        fetcher = SourceFetcher()
+        with patch.object(fetcher, "fetch_github_file", return_value=None) as mock_fetch:
+            assert fetcher.fetch_migration_guide("https://github.com/owner/repo") is None
+
+        # Repeated migration guide paths are only probed once
+        probed = [call.args[1] for call in mock_fetch.call_args_list]
+        assert len(probed) == len(set(probed))
+        fetcher.close()
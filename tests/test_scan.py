@@ -0,0 +1,51 @@
+"""Tests for the scan command helpers."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+from codeshift.cli.commands.scan import iter_latest_versions
+
+
+class TestIterLatestVersions:
+    """Tests for iter_latest_versions."""
+
+    @patch("httpx.Client.get")
+    def test_preserves_input_order(self, mock_get: MagicMock) -> None:
+        """Results follow the input order even when lookups finish out of order."""
+        latest = {"requests": ("2.31.0", 0.05), "click": ("8.1.7", 0.0), "rich": ("13.7.0", 0.02)}
+
+        def fake_get(url: str) -> MagicMock:
+            version, delay = latest[url.split("/")[-2]]
+            time.sleep(delay)
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {"info": {"version": version}}
+            return response
+
+        mock_get.side_effect = fake_get
+
+        assert list(iter_latest_versions(["requests", "click", "rich"])) == [
+            "2.31.0",
+            "8.1.7",
+            "13.7.0",
+        ]
+
+    @patch("httpx.Client.get")
+    def test_failed_lookup_yields_none(self, mock_get: MagicMock) -> None:
+        """A failed lookup yields None in its slot without affecting the others."""
+
+        def fake_get(url: str) -> MagicMock:
+            if "missing" in url:
+                raise ConnectionError("boom")
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {"info": {"version": "1.0.0"}}
+            return response
+
+        mock_get.side_effect = fake_get
+
+        assert list(iter_latest_versions(["missing", "present"])) == [None, "1.0.0"]
+
+    def test_empty_package_list(self) -> None:
+        """No packages means no lookups and no results."""
+        assert list(iter_latest_versions([])) == []
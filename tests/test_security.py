@@ -7,6 +7,7 @@ from pathlib import Path
 import pytest
 
 from codeshift.cli.commands.upgrade import _validate_state, load_state, save_state
+from codeshift.utils.credential_store import CredentialStore
 from codeshift.utils.path_safety import validate_file_within_project
 from codeshift.validator.test_runner import TestRunner
 
@@ -103,6 +104,14 @@ class TestValidateExtraArgs:
     def test_rejects_unrecognised_flags(self) -> None:
         assert TestRunner._validate_extra_args(["--evil-flag", "--random"]) == []
 
+    def test_rejects_partial_matches(self) -> None:
+        args = ["-vv", "--tb=shorter", "--maxfail=3x", "x--no-header", "--timeout="]
+        assert TestRunner._validate_extra_args(args) == []
+
+    def test_allows_selection_expressions(self) -> None:
+        args = ["-k test_foo", "-mslow"]
+        assert TestRunner._validate_extra_args(args) == args
+
     def test_mixed_safe_and_unsafe(self) -> None:
         result = TestRunner._validate_extra_args(["-v", "; rm -rf /", "--tb=short", "`id`"])
         assert result == ["-v", "--tb=short"]
@@ -131,6 +140,10 @@ class TestValidateSpecificTests:
         result = TestRunner._validate_specific_tests(["; rm -rf /"], tmp_path)
         assert result == []
 
+    def test_rejects_quotes_backslashes_and_newlines(self, tmp_path: Path) -> None:
+        tests = ['tests/"a".py', "tests/'a'.py", "tests\\a.py", "tests/a.py\nrm"]
+        assert TestRunner._validate_specific_tests(tests, tmp_path) == []
+
     def test_rejects_absolute_outside_path(self, tmp_path: Path) -> None:
         result = TestRunner._validate_specific_tests(["/etc/passwd"], tmp_path)
         assert result == []
@@ -290,3 +303,26 @@ class TestSaveState:
         state_file = tmp_path / ".codeshift" / "state.json"
         mode = stat.S_IMODE(state_file.stat().st_mode)
         assert mode == 0o600
+
+
+class TestCredentialStore:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        store = CredentialStore(config_dir=tmp_path)
+        store.save({"api_key": "secret123"})
+        assert CredentialStore(config_dir=tmp_path).load() == {"api_key": "secret123"}
+
+    def test_derives_key_once_per_salt(self, tmp_path: Path) -> None:
+        store = CredentialStore(config_dir=tmp_path)
+        calls = 0
+        original = store._get_machine_identifier
+
+        def counting_identifier() -> str:
+            nonlocal calls
+            calls += 1
+            return original()
+
+        store._get_machine_identifier = counting_identifier  # type: ignore[method-assign]
+        store.save({"api_key": "secret123"})
+        store.load()
+        store.load()
+        assert calls == 1
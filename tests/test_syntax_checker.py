@@ -30,6 +30,13 @@ class TestSyntaxChecker:
         result = checker.check_code("")
         assert result.is_valid
 
+    def test_compile_time_error(self):
+        """Test that errors raised by the compiler, not the parser, are caught."""
+        checker = SyntaxChecker()
+        result = checker.check_code("return 1")
+        assert not result.is_valid
+        assert result.errors[0].line_number == 1
+
     def test_multiline_valid_code(self):
         """Test checking valid multiline code."""
         checker = SyntaxChecker()